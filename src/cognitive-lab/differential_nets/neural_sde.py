@@ -5,11 +5,13 @@ modeled as flows on a Riemannian manifold.
     dX_t = f_θ(X_t, t)dt + g_θ(X_t, t)dW_t
 
 where f_θ is the drift (deterministic, tangent field on manifold),
-g_θ is diffusion (stochastic volatility), and dW_t is Wiener noise.
+g_θ is diffusion (stochastic volatility), and dW_t is Wiener noise — read in
+the Itô sense unless SDEConfig.sde_type selects Stratonovich.
 """
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import partial
 from typing import Callable, Optional, Tuple, List, Dict, Any
 from enum import IntEnum
 
@@ -17,8 +19,11 @@ import jax
 import jax.numpy as jnp
 import jax.random as jrand
 import numpy as np
+import diffrax
+import lineax
 import optax
 import flax.linen as nn
+from jax.sharding import Mesh, NamedSharding, PartitionSpec as P
 from flax.training import train_state
 
 
@@ -27,7 +32,7 @@ class SDEType(IntEnum):
     STRATONOVICH = 1
 
 
-@dataclass
+@dataclass(frozen=True)
 class SDEConfig:
     state_dim: int = 4
     hidden_dim: int = 128
@@ -36,7 +41,12 @@ class SDEConfig:
     activation: str = "tanh"
     use_layer_norm: bool = True
     solver: str = "euler"
+    # Calculus the SDE is read in; must match the solver (see SOLVER_SDE_TYPES)
+    sde_type: SDEType = SDEType.ITO
     dt: float = 0.01
+    # Integration step for the diffrax solvers, a whole multiple of dt; only
+    # the states they step to are returned. None steps on every dt
+    solver_dt: Optional[float] = None
     noise_type: str = "diagonal"
     learning_rate: float = 1e-3
     batch_size: int = 256
@@ -44,6 +54,15 @@ class SDEConfig:
     seed: int = 42
     dropout_rate: float = 0.1
     l2_reg: float = 1e-5
+    # Hidden-layer matmul dtype; parameters and outputs stay float32
+    compute_dtype: Any = jnp.float32
+
+
+ACTIVATIONS: Dict[str, Callable[[jnp.ndarray], jnp.ndarray]] = {
+    "tanh": jnp.tanh,
+    "relu": nn.relu,
+    "swish": nn.swish,
+}
 
 
 class DriftNet(nn.Module):
@@ -51,42 +70,68 @@ class DriftNet(nn.Module):
 
     config: SDEConfig
 
-    @nn.compact
+    def setup(self):
+        config = self.config
+        if config.activation not in ACTIVATIONS:
+            raise ValueError(f"Unknown activation: {config.activation}")
+
+        # Resolved once at construction so tracing sees a single fixed op
+        self.act = ACTIVATIONS[config.activation]
+        self.residual_layers = [
+            i > 0 and config.hidden_dim == config.state_dim
+            for i in range(config.num_layers)
+        ]
+
+        self.dense = [
+            nn.Dense(
+                features=config.hidden_dim,
+                kernel_init=nn.initializers.xavier_uniform(),
+                dtype=config.compute_dtype,
+                param_dtype=jnp.float32
+            )
+            for _ in range(config.num_layers)
+        ]
+        # Time enters through its own bias-free projection added to dense[0],
+        # equivalent to a first Dense over concat([x, t]). It runs in float32:
+        # bf16 spacing exceeds dt for t >= 1, so steps would share a time
+        self.time_dense = nn.Dense(
+            features=config.hidden_dim,
+            use_bias=False,
+            kernel_init=nn.initializers.xavier_uniform(),
+            dtype=jnp.float32,
+            param_dtype=jnp.float32
+        )
+        if config.use_layer_norm:
+            self.ln = [
+                nn.LayerNorm(dtype=config.compute_dtype, param_dtype=jnp.float32)
+                for _ in range(config.num_layers)
+            ]
+        self.dropout = nn.Dropout(rate=config.dropout_rate, deterministic=False)
+        self.output = nn.Dense(
+            features=config.output_dim,
+            kernel_init=nn.initializers.xavier_uniform()
+        )
+
     def __call__(self, x: jnp.ndarray, t: jnp.ndarray) -> jnp.ndarray:
-        h = jnp.concatenate([x, t], axis=-1)
+        # A scalar t projects to (hidden_dim,) and broadcasts over the batch
+        t = jnp.atleast_1d(t).astype(jnp.float32)
+        x = x.astype(self.config.compute_dtype)
+        h = x
 
-        for i in range(self.config.num_layers):
-            h_dense = nn.Dense(
-                features=self.config.hidden_dim,
-                kernel_init=nn.initializers.xavier_uniform(),
-                name=f'dense_{i}'
-            )(h)
+        for i, residual in enumerate(self.residual_layers):
+            h_dense = self.dense[i](h)
+            if i == 0:
+                h_dense = h_dense + self.time_dense(t).astype(self.config.compute_dtype)
 
             if self.config.use_layer_norm:
-                h_dense = nn.LayerNorm(name=f'ln_{i}')(h_dense)
-
-            if self.config.activation == "tanh":
-                h_act = jnp.tanh(h_dense)
-            elif self.config.activation == "relu":
-                h_act = jnp.relu(h_dense)
-            elif self.config.activation == "swish":
-                h_act = jnp.swish(h_dense)
-            else:
-                raise ValueError(f"Unknown activation: {self.config.activation}")
-
-            h = nn.Dropout(
-                rate=self.config.dropout_rate,
-                deterministic=False
-            )(h_act)
-
-            if i > 0 and h.shape == x.shape:
+                h_dense = self.ln[i](h_dense)
+
+            h = self.dropout(self.act(h_dense))
+
+            if residual:
                 h = h + x
 
-        return nn.Dense(
-            features=self.config.output_dim,
-            kernel_init=nn.initializers.xavier_uniform(),
-            name='output'
-        )(h)
+        return self.output(h.astype(jnp.float32))
 
 
 class DiffusionNet(nn.Module):
@@ -96,23 +141,83 @@ class DiffusionNet(nn.Module):
 
     @nn.compact
     def __call__(self, x: jnp.ndarray, t: jnp.ndarray) -> jnp.ndarray:
-        h = jnp.concatenate([x, t], axis=-1)
+        dtype = self.config.compute_dtype
+        # A scalar t projects to (hidden_dim,) and broadcasts over the batch
+        # t stays float32 through its projection (see DriftNet.time_dense)
+        t = jnp.atleast_1d(t).astype(jnp.float32)
+        h = x.astype(dtype)
 
         for i in range(self.config.num_layers):
-            h = nn.Dense(features=self.config.hidden_dim, name=f'diff_dense_{i}')(h)
-            h = nn.LayerNorm(name=f'diff_ln_{i}')(h)
+            h = nn.Dense(
+                features=self.config.hidden_dim, dtype=dtype,
+                param_dtype=jnp.float32, name=f'diff_dense_{i}'
+            )(h)
+            if i == 0:
+                h = h + nn.Dense(
+                    features=self.config.hidden_dim, use_bias=False, dtype=jnp.float32,
+                    param_dtype=jnp.float32, name='diff_time_dense'
+                )(t).astype(dtype)
+            h = nn.LayerNorm(dtype=dtype, param_dtype=jnp.float32, name=f'diff_ln_{i}')(h)
             h = jnp.tanh(h)
 
+        # Softplus head runs in float32: volatility scales the Wiener noise
+        h = h.astype(jnp.float32)
+
         if self.config.noise_type == "diagonal":
             g_log = nn.Dense(features=self.config.output_dim, name='diff_output')(h)
-            return jnp.softplus(g_log)
+            return jax.nn.softplus(g_log)
         elif self.config.noise_type == "scalar":
             g_log = nn.Dense(features=1, name='diff_output')(h)
-            return jnp.softplus(g_log)
+            return jax.nn.softplus(g_log)
         else:
             raise NotImplementedError("General diffusion not implemented")
 
 
+# Heun converges to the Stratonovich solution; with diagonal (commutative)
+# noise it has strong order 1 against Euler-Maruyama's 1/2.
+DIFFRAX_SOLVERS = {
+    "heun": diffrax.Heun,
+}
+
+SOLVER_SDE_TYPES: Dict[str, SDEType] = {
+    "euler": SDEType.ITO,
+    "heun": SDEType.STRATONOVICH,
+}
+
+
+def solver_save_steps(config: SDEConfig, solver: str, num_steps: int) -> np.ndarray:
+    """dt-grid step indices (1-based) at which solver returns states.
+
+    Euler-Maruyama always returns every step; the diffrax solvers return
+    every solver_dt / dt-th one, plus the final step if it falls in between.
+    """
+    if solver == "euler" or config.solver_dt is None:
+        return np.arange(1, num_steps + 1)
+
+    stride = int(round(config.solver_dt / config.dt))
+    if stride < 1 or abs(stride * config.dt - config.solver_dt) > 1e-6 * config.solver_dt:
+        raise ValueError(
+            f"solver_dt={config.solver_dt} is not a whole multiple of dt={config.dt}"
+        )
+    return np.append(np.arange(stride, num_steps, stride), num_steps)
+
+
+def batch_mesh() -> Mesh:
+    """1-D mesh over every device; the batch axis is split along it."""
+    return Mesh(np.array(jax.devices()), ('batch',))
+
+
+def shard_batch(x: jnp.ndarray, batch_axis: int) -> jnp.ndarray:
+    """Constrain x's batch axis across all devices; no-op on a single device
+    or when the batch does not divide evenly."""
+    num_devices = jax.device_count()
+    if num_devices == 1 or x.shape[batch_axis] % num_devices:
+        return x
+    spec = [None] * x.ndim
+    spec[batch_axis] = 'batch'
+    return jax.lax.with_sharding_constraint(x, NamedSharding(batch_mesh(), P(*spec)))
+
+
 class NeuralSDE(nn.Module):
     """dX_t = f_θ(X_t, t)dt + g_θ(X_t, t)dW_t"""
 
@@ -133,57 +238,169 @@ class NeuralSDE(nn.Module):
         x0: jnp.ndarray,
         t_span: Tuple[float, float],
         key: jax.random.PRNGKey,
-        solver: str = "euler"
+        solver: Optional[str] = None,
+        num_steps: Optional[int] = None
     ) -> jnp.ndarray:
         t0, t1 = t_span
         dt = self.config.dt
-        num_steps = int((t1 - t0) / dt)
+        if solver is None:
+            solver = self.config.solver
+        if num_steps is None:
+            num_steps = int((t1 - t0) / dt)
+
+        # Create parameters outside the solver loop so none are traced inside it
+        if self.is_initializing():
+            self.drift(x0, t0)
+            self.diffusion(x0, t0)
+
+        if solver not in SOLVER_SDE_TYPES:
+            raise ValueError(f"Unknown solver: {solver}")
+        if SOLVER_SDE_TYPES[solver] != self.config.sde_type:
+            raise ValueError(
+                f"Solver {solver!r} integrates the {SOLVER_SDE_TYPES[solver].name} "
+                f"SDE but config.sde_type is {self.config.sde_type.name}"
+            )
+
+        if solver == "euler":
+            return self.euler_maruyama(x0, t0, num_steps, key)
+        return self.diffrax_solve(x0, t0, num_steps, key, solver)
+
+    def euler_maruyama(
+        self,
+        x0: jnp.ndarray,
+        t0: float,
+        num_steps: int,
+        key: jax.random.PRNGKey
+    ) -> jnp.ndarray:
+        """Fixed-step Itô scheme at config.dt; strong order 1/2."""
+        dt = self.config.dt
 
-        def body_fn(carry, step):
-            x, key = carry
-            t = t0 + step * dt
-            t_batch = jnp.full((x.shape[0], 1), t)
+        # All Wiener increments up front: no key threading through the scan
+        dW_all = jrand.normal(key, (num_steps,) + x0.shape) * jnp.sqrt(dt)
 
-            f = self.drift(x, t_batch)
-            g = self.diffusion(x, t_batch)
+        def body_fn(x, inputs):
+            step, dW = inputs
+            t = t0 + step * dt
 
-            key, subkey = jrand.split(key)
-            dW = jrand.normal(subkey, x.shape) * jnp.sqrt(dt)
+            f = self.drift(x, t)
+            g = self.diffusion(x, t)
 
-            # Euler-Maruyama (Milstein omitted — requires autodiff of g)
             dx = f * dt + g * dW
             x_new = x + dx
 
-            return (x_new, key), x_new
+            return x_new, x_new
 
-        (_, _), trajectory = jax.lax.scan(body_fn, (x0, key), jnp.arange(num_steps))
+        _, trajectory = jax.lax.scan(body_fn, x0, (jnp.arange(num_steps), dW_all))
         return trajectory
 
+    def diffrax_solve(
+        self,
+        x0: jnp.ndarray,
+        t0: float,
+        num_steps: int,
+        key: jax.random.PRNGKey,
+        solver: str
+    ) -> jnp.ndarray:
+        """Stratonovich SDE solve stepping on, and saving, the solver_dt grid.
+
+        Heun costs two drift/diffusion evaluations per step, so it only beats
+        Euler-Maruyama when solver_dt is a few dt; its strong order 1 keeps
+        the error of those coarser steps in check.
+        """
+        steps = solver_save_steps(self.config, solver, num_steps)
+        # t0/t1 come from the grid itself; float32 t0 + num_steps * dt need not
+        # match its last entry, and diffrax requires them to be bitwise equal
+        ts = t0 + self.config.dt * jnp.asarray(np.append(0, steps))
+        t0, t1 = ts[0], ts[-1]
+
+        brownian = diffrax.VirtualBrownianTree(
+            t0, t1, tol=self.config.dt / 8, shape=x0.shape, key=key
+        )
+        terms = diffrax.MultiTerm(
+            diffrax.ODETerm(lambda t, x, args: self.drift(x, t)),
+            diffrax.ControlTerm(
+                lambda t, x, args: lineax.DiagonalLinearOperator(
+                    jnp.broadcast_to(self.diffusion(x, t), x.shape)
+                ),
+                brownian
+            )
+        )
+
+        solution = diffrax.diffeqsolve(
+            terms,
+            DIFFRAX_SOLVERS[solver](),
+            t0=t0,
+            t1=t1,
+            dt0=None,
+            y0=x0,
+            saveat=diffrax.SaveAt(ts=ts[1:]),
+            stepsize_controller=diffrax.StepTo(ts=ts),
+            adjoint=diffrax.RecursiveCheckpointAdjoint(),
+            max_steps=len(steps),
+            # StepTo takes exactly len(steps) steps, so the runtime check can
+            # never fire; its host callback would pin the loop to one device
+            throw=False
+        )
+        return shard_batch(solution.ys, batch_axis=1)
+
 
-def solve_ode_rk4(
+@partial(jax.jit, static_argnames=('drift_fn', 't_span', 'dt', 'rtol', 'atol'))
+def solve_ode(
     drift_fn: Callable[[jnp.ndarray, float], jnp.ndarray],
     x0: jnp.ndarray,
     t_span: Tuple[float, float],
-    dt: float = 0.01
+    dt: float = 0.01,
+    rtol: float = 1e-6,
+    atol: float = 1e-6
 ) -> jnp.ndarray:
-    """RK4 solver for ODEs (no noise) — useful for drift validation."""
+    """Adaptive Tsit5 solver for ODEs (no noise) — useful for drift validation.
+
+    dt is only the initial step and the spacing of the returned states;
+    the PID controller picks the actual steps from rtol/atol.
+    """
     t0, t1 = t_span
     num_steps = int((t1 - t0) / dt)
+    # As in diffrax_solve: t0/t1 come from the float32 save grid so the last
+    # save time cannot land past t1
+    ts = t0 + dt * jnp.arange(num_steps + 1)
+
+    solution = diffrax.diffeqsolve(
+        diffrax.ODETerm(lambda t, x, args: drift_fn(x, t)),
+        diffrax.Tsit5(),
+        t0=ts[0],
+        t1=ts[-1],
+        dt0=dt,
+        y0=x0,
+        saveat=diffrax.SaveAt(ts=ts[1:]),
+        stepsize_controller=diffrax.PIDController(rtol=rtol, atol=atol)
+    )
+    return solution.ys
 
-    def rk4_step(x, t):
-        k1 = drift_fn(x, t)
-        k2 = drift_fn(x + 0.5 * dt * k1, t + 0.5 * dt)
-        k3 = drift_fn(x + 0.5 * dt * k2, t + 0.5 * dt)
-        k4 = drift_fn(x + dt * k3, t + dt)
-        return x + (dt / 6.0) * (k1 + 2*k2 + 2*k3 + k4)
 
-    def body_fn(x, step):
-        t = t0 + step * dt
-        x_new = rk4_step(x, t)
-        return x_new, x_new
+def solve_trajectories(
+    params: Dict,
+    model: NeuralSDE,
+    x0: jnp.ndarray,
+    t_span: Tuple[float, float],
+    key: jax.random.PRNGKey,
+    num_steps: Optional[int] = None
+) -> jnp.ndarray:
+    """Solve a batch of trajectories: (B, D) initial states → (B, T, D).
 
-    _, trajectory = jax.lax.scan(body_fn, x0, jnp.arange(num_steps))
-    return trajectory
+    T is the number of solver_save_steps; it equals num_steps unless a
+    diffrax solver steps at a coarser solver_dt.
+
+    With several devices the batch axis is sharded across them, so XLA
+    partitions the solver loop and each device integrates its own slice.
+    """
+    x0 = shard_batch(x0, batch_axis=0)
+
+    sde_key, dropout_key = jrand.split(key)
+    trajectory = model.apply(
+        {'params': params}, x0, t_span, sde_key,
+        num_steps=num_steps, rngs={'dropout': dropout_key}
+    )
+    return shard_batch(jnp.swapaxes(trajectory, 0, 1), batch_axis=0)
 
 
 def sde_loss_fn(
@@ -196,25 +413,28 @@ def sde_loss_fn(
     """Loss = reconstruction MSE + drift smoothness regularization."""
     x0 = x_batch[:, 0, :]
     t_span = (t_batch[0, 0, 0], t_batch[0, -1, 0])
+    key, dropout_key = jrand.split(key)
 
-    trajectory = model.apply(
-        {'params': params}, x0, t_span, key, solver='euler'
+    # num_steps comes from the (static) batch shape so t_span may be traced
+    trajectory = solve_trajectories(
+        params, model, x0, t_span, key, num_steps=x_batch.shape[1]
     )
 
-    reconstruction_loss = jnp.mean((trajectory - x_batch) ** 2)
-
-    def smoothness_reg_fn(x_t, t):
-        drift = model.drift(x_t, t)
-        return jnp.sum(drift ** 2)
+    # A coarse-stepping solver is scored only on the states it returns
+    steps = solver_save_steps(model.config, model.config.solver, x_batch.shape[1])
+    reconstruction_loss = jnp.mean((trajectory - x_batch[:, steps - 1]) ** 2)
 
+    # DriftNet is already batched, so one forward pass covers every sample
     sample_x = x_batch[:, ::10, :]
     sample_t = t_batch[:, ::10, :]
-    smoothness_loss = jnp.mean(
-        jax.vmap(smoothness_reg_fn)(
-            sample_x.reshape(-1, sample_x.shape[-1]),
-            sample_t.reshape(-1, sample_t.shape[-1])
-        )
+    drift_all = model.apply(
+        {'params': params},
+        sample_x.reshape(-1, sample_x.shape[-1]),
+        sample_t.reshape(-1, 1),
+        method=NeuralSDE.drift,
+        rngs={'dropout': dropout_key}
     )
+    smoothness_loss = jnp.mean(jnp.sum(drift_all ** 2, axis=-1))
 
     total_loss = reconstruction_loss + 1e-3 * smoothness_loss
     metrics = {
@@ -232,14 +452,27 @@ def create_train_state(
     learning_rate: float
 ) -> train_state.TrainState:
     x_dummy = jnp.zeros((1, model.config.state_dim))
-    params = model.init(key, x_dummy, (0.0, 1.0), key)['params']
+    params = model.init({'params': key, 'dropout': key}, x_dummy, (0.0, 1.0), key)['params']
     tx = optax.adam(learning_rate)
 
-    return train_state.TrainState.create(
+    state = train_state.TrainState.create(
         apply_fn=model.apply, params=params, tx=tx
     )
+    # A Python-int step would make train_step retrace after its first call
+    state = state.replace(step=jnp.asarray(state.step, dtype=jnp.int32))
+    if jax.device_count() > 1:
+        # train_step returns the state replicated over the mesh; start it
+        # there too or the second call retraces on the new input sharding
+        state = jax.device_put(state, NamedSharding(batch_mesh(), P()))
+    return state
 
 
+sde_loss_and_grad = jax.value_and_grad(sde_loss_fn, has_aux=True)
+
+
+# model is hashed by its (frozen) config, so the step compiles once per model;
+# the batches carry t_span as traced arrays and never force a retrace
+@partial(jax.jit, static_argnames=('model',))
 def train_step(
     state: train_state.TrainState,
     model: NeuralSDE,
@@ -247,11 +480,29 @@ def train_step(
     t_batch: jnp.ndarray,
     key: jax.random.PRNGKey
 ) -> Tuple[train_state.TrainState, Dict]:
-    loss_fn = lambda params: sde_loss_fn(params, model, x_batch, t_batch, key)
-    (loss, metrics), grads = jax.value_and_grad(loss_fn, has_aux=True)(state.params)
+    (loss, metrics), grads = sde_loss_and_grad(state.params, model, x_batch, t_batch, key)
     return state.apply_gradients(grads=grads), metrics
 
 
+@partial(jax.jit, static_argnames=('model',))
+def train_n_steps(
+    state: train_state.TrainState,
+    model: NeuralSDE,
+    x_batch: jnp.ndarray,
+    t_batch: jnp.ndarray,
+    keys: jnp.ndarray
+) -> Tuple[train_state.TrainState, Dict]:
+    """One train_step per key inside a single compiled scan.
+
+    Metrics come back stacked along a leading axis of len(keys).
+    """
+    def step_fn(state, key):
+        return train_step(state, model, x_batch, t_batch, key)
+
+    return jax.lax.scan(step_fn, state, keys)
+
+
+@partial(jax.jit, static_argnames=('num_samples', 'num_steps', 'state_dim'))
 def generate_synthetic_data(
     key: jax.random.PRNGKey,
     num_samples: int = 1000,
@@ -262,19 +513,17 @@ def generate_synthetic_data(
     """Ornstein-Uhlenbeck process: dX = θ(μ - X)dt + σdW"""
     theta, mu, sigma = 0.1, 0.0, 0.2
 
-    x0 = jrand.normal(key, (num_samples, state_dim))
+    x0_key, noise_key = jrand.split(key)
+    x0 = jrand.normal(x0_key, (num_samples, state_dim))
+    noise = jrand.normal(noise_key, (num_steps, num_samples, state_dim)) * jnp.sqrt(dt)
 
-    def ou_step(x, key):
-        dW = jrand.normal(key, x.shape) * jnp.sqrt(dt)
+    def ou_step(x, dW):
         dx = theta * (mu - x) * dt + sigma * dW
         return x + dx, x + dx
 
-    keys = jrand.split(key, num_steps)
-    _, trajectories = jax.lax.scan(
-        lambda x, k: ou_step(x, k), x0, jnp.stack(keys)
-    )
+    _, trajectories = jax.lax.scan(ou_step, x0, noise)
 
-    x = trajectories.T
+    x = jnp.transpose(trajectories, (1, 0, 2))
     t = jnp.linspace(0, num_steps * dt, num_steps)
     t = jnp.tile(t[None, :, None], (num_samples, 1, 1))
 
@@ -284,7 +533,9 @@ def generate_synthetic_data(
 if __name__ == "__main__":
     config = SDEConfig(
         state_dim=4, hidden_dim=128, num_layers=3,
-        learning_rate=1e-3, batch_size=256, num_epochs=100, seed=42
+        learning_rate=1e-3, batch_size=256, num_epochs=100, seed=42,
+        # bf16 matmuls pay off on GPU/TPU; CPUs emulate them
+        compute_dtype=jnp.float32 if jax.default_backend() == "cpu" else jnp.bfloat16
     )
 
     model = NeuralSDE(config)
@@ -299,12 +550,15 @@ if __name__ == "__main__":
     print(f"Neural SDE initialized")
     print(f"Parameters: {sum(p.size for p in jax.tree_util.tree_leaves(state.params))}")
 
-    for epoch in range(5):
-        key, epoch_key = jrand.split(key)
-        x_batch = x_data[:config.batch_size]
-        t_batch = t_data[:config.batch_size]
+    key, train_key = jrand.split(key)
+    x_batch = x_data[:config.batch_size]
+    t_batch = t_data[:config.batch_size]
 
-        state, metrics = train_step(state, model, x_batch, t_batch, epoch_key)
-        print(f"Epoch {epoch}: loss={metrics['loss']:.6f}")
+    # All epochs run in one XLA call; metrics are stacked per epoch
+    state, metrics = train_n_steps(
+        state, model, x_batch, t_batch, jrand.split(train_key, 5)
+    )
+    for epoch, loss in enumerate(metrics['loss'].tolist()):
+        print(f"Epoch {epoch}: loss={loss:.6f}")
 
     print("Training complete!")
@@ -1,14 +1,24 @@
-import subprocess
+import asyncio
 import threading
-import json
 import time
 import os
 import random
+import orjson
 from flask import Flask
 from flask_socketio import SocketIO
 
+class OrjsonCodec:
+    """orjson with the str-returning dumps() interface socketio expects."""
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, cors_allowed_origins="*", json=OrjsonCodec)
 
 # --- CONFIIGURATION ---
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -31,64 +41,95 @@ RUST_PATHS = [
 ]
 RUST_ENGINE_PATH = next((p for p in RUST_PATHS if os.path.exists(p)), None)
 
+# Tensor updates are coalesced and flushed once per tick; the dashboard
+# only renders the latest metric, so intermediate frames are redundant.
+TENSOR_FLUSH_INTERVAL = 0.01  # seconds
+
+# StreamReader's 64 KiB default line limit ends the stream on one long
+# engine line, and the unread pipe then blocks the engine; allow full frames.
+STREAM_LINE_LIMIT = 16 * 1024 * 1024  # bytes
+
 # --- UTILS ---
-def stream_process_output(process, name, log_type='info'):
+async def stream_process_output(process, name, pending_tensors, log_type='info'):
     """Reads stdout/stderr from a process and emits to WebSocket."""
-    for line in iter(process.stdout.readline, ''):
-        if not line: break
-        line = line.strip()
-        if not line: continue
+    async for raw_line in process.stdout:
+        raw_line = raw_line.strip()
+        if not raw_line: continue
         
-        # Detect JSON (C++ Engine)
-        if line.startswith('{') and line.endswith('}'):
+        # Detect JSON (C++ Engine); orjson parses the raw bytes directly
+        if raw_line[0] == ord('{') and raw_line[-1] == ord('}'):
             try:
-                data = json.loads(line)
+                data = orjson.loads(raw_line)
                 if data.get('type') == 'tensor_update':
-                    socketio.emit('tensor_update', data)
+                    pending_tensors[name] = data
                 else:
                     # Log other JSON messages
                     socketio.emit('system_log', {
                         'message': data.get('message', str(data)), 
                         'type': data.get('type', 'info')
                     })
-            except json.JSONDecodeError:
-                print(f"[{name} JSON ERR] {line}")
+            except orjson.JSONDecodeError:
+                print(f"[{name} JSON ERR] {raw_line.decode(errors='replace')}")
         else:
             # Raw Text Log
+            line = raw_line.decode(errors='replace')
             print(f"[{name}] {line}")
             socketio.emit('system_log', {'message': f"[{name}] {line}", 'type': log_type})
 
-def run_cpp_engine():
+async def flush_tensor_updates(pending_tensors):
+    """Emits the latest tensor_update per process once every tick."""
+    while True:
+        await asyncio.sleep(TENSOR_FLUSH_INTERVAL)
+        for name in list(pending_tensors):
+            socketio.emit('tensor_update', pending_tensors.pop(name))
+
+async def run_cpp_engine(pending_tensors):
     if not CPP_ENGINE_PATH:
         print("[Bridge] WARN: C++ Engine not found.")
         return
     
     print(f"[Bridge] Starting C++ Engine: {CPP_ENGINE_PATH}")
-    proc = subprocess.Popen(
-        [CPP_ENGINE_PATH],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT, # Merge stderr into stdout
-        text=True,
-        bufsize=1,
-        universal_newlines=True
+    proc = await asyncio.create_subprocess_exec(
+        CPP_ENGINE_PATH,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT, # Merge stderr into stdout
+        limit=STREAM_LINE_LIMIT
     )
-    stream_process_output(proc, "PHYSICS-CORE", "info")
+    await stream_process_output(proc, "PHYSICS-CORE", pending_tensors, "info")
 
-def run_rust_ingestor():
+async def run_rust_ingestor(pending_tensors):
     if not RUST_ENGINE_PATH:
         print("[Bridge] WARN: Rust Ingestor not found. (Run 'cargo build --release' in src/nervous-system)")
         return
 
     print(f"[Bridge] Starting Rust Ingestor: {RUST_ENGINE_PATH}")
-    proc = subprocess.Popen(
-        [RUST_ENGINE_PATH],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
-        universal_newlines=True
+    proc = await asyncio.create_subprocess_exec(
+        RUST_ENGINE_PATH,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        limit=STREAM_LINE_LIMIT
     )
-    stream_process_output(proc, "NERVOUS-SYS", "success")
+    await stream_process_output(proc, "NERVOUS-SYS", pending_tensors, "success")
+
+async def run_isolated(runner, name, pending_tensors):
+    """Runs one engine so its failure is logged instead of stopping the others."""
+    try:
+        await runner(pending_tensors)
+    except Exception as exc:
+        print(f"[Bridge] ERROR: {name} failed: {exc!r}")
+        socketio.emit('system_log', {'message': f"[Bridge] {name} failed: {exc}", 'type': 'error'})
+
+async def run_subprocess_bridge():
+    """Services both engine pipes concurrently on a single event loop."""
+    pending_tensors = {}
+    flusher = asyncio.create_task(flush_tensor_updates(pending_tensors))
+    await asyncio.gather(
+        run_isolated(run_cpp_engine, "PHYSICS-CORE", pending_tensors),
+        run_isolated(run_rust_ingestor, "NERVOUS-SYS", pending_tensors)
+    )
+    # Let the final frame go out, then stop ticking
+    await asyncio.sleep(TENSOR_FLUSH_INTERVAL)
+    flusher.cancel()
 
 def simulate_lisp_supervisor():
     """Simulates the Lisp Symbolic Logic Supervisor occasionally injecting 'thoughts'."""
@@ -118,12 +159,9 @@ def handle_volatility(data):
     socketio.emit('system_log', {'message': f"CORE: Ack command '{cmd}'", 'type': 'warn'})
 
 if __name__ == '__main__':
-    # Start Subprocesses
-    t_cpp = threading.Thread(target=run_cpp_engine, daemon=True)
-    t_cpp.start()
-
-    t_rust = threading.Thread(target=run_rust_ingestor, daemon=True)
-    t_rust.start()
+    # Start Subprocesses (one asyncio loop reads every engine pipe)
+    t_bridge = threading.Thread(target=asyncio.run, args=(run_subprocess_bridge(),), daemon=True)
+    t_bridge.start()
 
     t_lisp = threading.Thread(target=simulate_lisp_supervisor, daemon=True)
     t_lisp.start()
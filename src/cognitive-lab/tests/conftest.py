@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Module directories are not packages; expose them the way the scripts run
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, 'topology'))
+sys.path.insert(0, os.path.join(BASE_DIR, 'differential_nets'))
@@ -0,0 +1,110 @@
+import jax
+import jax.numpy as jnp
+import pytest
+
+from neural_sde import (
+    SDEConfig,
+    SDEType,
+    NeuralSDE,
+    create_train_state,
+    generate_synthetic_data,
+    solve_ode,
+    solve_trajectories,
+    solver_save_steps,
+    train_step,
+)
+
+HEUN = dict(solver="heun", sde_type=SDEType.STRATONOVICH)
+COARSE_HEUN = dict(HEUN, solver_dt=0.04)
+
+
+def make_state(**config_kwargs):
+    config = SDEConfig(hidden_dim=16, num_layers=2, **config_kwargs)
+    model = NeuralSDE(config)
+    return model, create_train_state(model, jax.random.PRNGKey(0), config.learning_rate)
+
+
+@pytest.mark.parametrize("num_steps", [5, 10, 30, 99])
+def test_heun_solves_any_step_count(num_steps):
+    model, state = make_state(**HEUN)
+    x0 = jnp.ones((2, model.config.state_dim))
+    t_span = (0.0, num_steps * model.config.dt)
+
+    trajectory = solve_trajectories(
+        state.params, model, x0, t_span, jax.random.PRNGKey(1), num_steps
+    )
+
+    assert trajectory.shape == (2, num_steps, model.config.state_dim)
+    assert jnp.all(jnp.isfinite(trajectory))
+
+
+@pytest.mark.parametrize("num_steps", [8, 10])
+def test_coarse_heun_returns_its_steps(num_steps):
+    model, state = make_state(**COARSE_HEUN)
+    x0 = jnp.ones((2, model.config.state_dim))
+    t_span = (0.0, num_steps * model.config.dt)
+    steps = solver_save_steps(model.config, "heun", num_steps)
+
+    trajectory = solve_trajectories(
+        state.params, model, x0, t_span, jax.random.PRNGKey(1), num_steps
+    )
+
+    assert steps.tolist() == list(range(4, num_steps, 4)) + [num_steps]
+    assert trajectory.shape == (2, len(steps), model.config.state_dim)
+    assert jnp.all(jnp.isfinite(trajectory))
+
+
+def test_solver_dt_must_be_multiple_of_dt():
+    with pytest.raises(ValueError):
+        make_state(**dict(COARSE_HEUN, solver_dt=0.025))
+
+
+@pytest.mark.parametrize(
+    "solver_kwargs", [{}, HEUN, COARSE_HEUN], ids=["euler", "heun", "coarse-heun"]
+)
+def test_train_step_on_synthetic_data(solver_kwargs):
+    model, state = make_state(**solver_kwargs)
+    x, t = generate_synthetic_data(jax.random.PRNGKey(2), num_samples=8, num_steps=20)
+
+    state, metrics = train_step(state, model, x, t, jax.random.PRNGKey(3))
+
+    assert int(state.step) == 1
+    assert jnp.isfinite(metrics['loss'])
+
+
+def test_solver_must_match_sde_type():
+    with pytest.raises(ValueError):
+        make_state(solver="heun")
+
+
+def decay(x, t):
+    return -x
+
+
+@pytest.mark.parametrize(
+    "t_span, dt", [((0.0, 1.0), 0.01), ((0.0, 9.9), 0.1), ((0.1, 0.59), 0.07)]
+)
+def test_solve_ode_matches_exponential_decay(t_span, dt):
+    t0, t1 = t_span
+    num_steps = int((t1 - t0) / dt)
+
+    ys = solve_ode(decay, jnp.ones(2), t_span, dt)
+
+    t = dt * jnp.arange(1, num_steps + 1)
+    assert ys.shape == (num_steps, 2)
+    assert jnp.allclose(ys, jnp.exp(-t)[:, None], rtol=1e-4, atol=1e-5)
+
+
+@pytest.mark.parametrize("method", [NeuralSDE.drift, NeuralSDE.diffusion])
+def test_bf16_networks_tell_consecutive_steps_apart(method):
+    # 2.04 and 2.05 round to the same bfloat16 value
+    model, state = make_state(compute_dtype=jnp.bfloat16)
+    x = jnp.ones((1, model.config.state_dim))
+    rngs = {'dropout': jax.random.PRNGKey(4)}
+
+    out = [
+        model.apply({'params': state.params}, x, jnp.float32(t), method=method, rngs=rngs)
+        for t in (2.04, 2.05)
+    ]
+
+    assert not jnp.array_equal(out[0], out[1])
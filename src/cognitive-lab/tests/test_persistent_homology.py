@@ -0,0 +1,128 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import persistent_homology
+from persistent_homology import (
+    TDAConfig,
+    VietorisRipsComplex,
+    PersistentHomology,
+    detect_market_crash_via_topology,
+)
+
+
+def compute_intervals(points, **config_kwargs):
+    config = TDAConfig(**config_kwargs)
+    vr = VietorisRipsComplex(config)
+    vr.build(points)
+    return vr, PersistentHomology(config).compute(vr)
+
+
+def brute_force_pairs(vr):
+    """Dense Z/2 reduction over the whole filtration: {dim: [(birth, death)]}."""
+    index = {}
+    for i, (verts, dim) in enumerate(zip(vr.filtration_vertices.tolist(), vr.filtration_dims.tolist())):
+        index[tuple(verts[:dim + 1])] = i
+
+    pairs = {}
+    pivots = {}
+    for j, (verts, dim) in enumerate(zip(vr.filtration_vertices.tolist(), vr.filtration_dims.tolist())):
+        verts = verts[:dim + 1]
+        column = {index[tuple(verts[:k] + verts[k + 1:])] for k in range(dim + 1)} if dim else set()
+        while column and max(column) in pivots:
+            column ^= pivots[max(column)]
+        if column:
+            low = max(column)
+            pivots[low] = column
+            birth, death = vr.filtration_radii[low], vr.filtration_radii[j]
+            if death > birth:
+                pairs.setdefault(dim - 1, []).append((birth, death))
+    return pairs
+
+
+def as_sorted_pairs(intervals):
+    return sorted((iv.birth, iv.death) for iv in intervals)
+
+
+def test_circle_has_one_h1_bar():
+    t = np.linspace(0, 2 * np.pi, 30, endpoint=False)
+    points = np.column_stack([np.cos(t), np.sin(t)])
+
+    _, intervals = compute_intervals(points, max_radius=2.5)
+
+    assert len(intervals[1]) == 1
+    assert intervals[1][0].birth == pytest.approx(2 * np.sin(np.pi / 30))
+    assert intervals[1][0].death == pytest.approx(np.sqrt(3), rel=1e-2)
+
+
+@pytest.mark.parametrize("max_radius", [1.0, 2.0])
+def test_line_has_no_h1_bars(max_radius):
+    points = np.column_stack([np.arange(5) * 0.9, np.zeros(5)])
+
+    _, intervals = compute_intervals(points, max_radius=max_radius)
+
+    assert intervals[1] == []
+    assert len(intervals[0]) == 4
+
+
+def test_line_without_triangles_is_low_risk():
+    points = np.column_stack([np.arange(5) * 0.9, np.zeros(5)])
+
+    result = detect_market_crash_via_topology(points)
+
+    assert result['risk_level'] == "LOW"
+    assert result['intervals'][1] == []
+
+
+def test_connected_cloud_h0_count():
+    points = np.random.default_rng(0).random((30, 3))
+
+    _, intervals = compute_intervals(points, max_radius=2.0)
+
+    assert len(intervals[0]) == 29
+
+
+def test_max_dim_one_reports_only_cycle_edges():
+    points = np.random.default_rng(1).random((20, 2))
+
+    vr, intervals = compute_intervals(points, max_dim=1, max_radius=2.0)
+
+    # Connected graph: every edge beyond a spanning tree closes one cycle
+    assert len(intervals[1]) == len(vr.simplices[1]) - 19
+    assert all(iv.death == float('inf') for iv in intervals[1])
+
+
+def test_max_dim_three_builds():
+    points = np.random.default_rng(2).random((15, 3))
+
+    _, intervals = compute_intervals(points, max_dim=3)
+
+    assert set(intervals) == {0, 1, 2, 3}
+
+
+def test_triangles_independent_of_chunk_size(monkeypatch):
+    points = np.random.default_rng(3).random((30, 3))
+    dist = np.linalg.norm(points[:, None] - points[None], axis=-1)
+    expected = [
+        t for t in itertools.combinations(range(30), 3)
+        if max(dist[a, b] for a, b in itertools.combinations(t, 2)) <= 0.5
+    ]
+
+    monkeypatch.setattr(persistent_homology, 'TRIANGLE_CHUNK_CELLS', 7 * 30)
+    vr, _ = compute_intervals(points, max_radius=0.5)
+
+    assert sorted(map(tuple, vr.simplices[2].vertices.tolist())) == expected
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_matches_brute_force_reduction(seed):
+    points = np.random.default_rng(seed).random((15, 3))
+
+    vr, intervals = compute_intervals(points, max_radius=0.6)
+    expected = brute_force_pairs(vr)
+
+    assert len(vr.simplices[2]) > 0
+    for dim in (0, 1):
+        finite = [iv for iv in intervals[dim] if iv.death != float('inf')]
+        assert as_sorted_pairs(finite) == sorted(expected.get(dim, []))
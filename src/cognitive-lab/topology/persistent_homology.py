@@ -7,11 +7,12 @@ that persist across multiple filtration scales. Many persistent H1 features
 """
 
 from dataclasses import dataclass
-from typing import List, Tuple, Dict, Optional, Set
+from typing import List, Tuple, Dict, Optional
 from enum import IntEnum
 import numpy as np
-from scipy.sparse import csr_matrix, eye
+from scipy.sparse import csc_matrix, eye
 from scipy.sparse.linalg import inv
+from scipy.spatial.distance import pdist, squareform
 from collections import defaultdict
 import warnings
 
@@ -32,25 +33,49 @@ class SimplexType(IntEnum):
     TETRAHEDRON = 3
 
 
-@dataclass
-class Simplex:
-    """k-simplex: convex hull of (k+1) affinely independent points."""
-    vertices: Tuple[int, ...]
-    dimension: int
-    radius: float = 0.0
+# Vertex ids are packed 16 bits apiece, so up to 4 vertices (a 3-simplex)
+# share one uint64 key and complexes are limited to 2^16 points.
+VERTEX_BITS = 16
+MAX_VERTICES = 1 << VERTEX_BITS
 
-    def __post_init__(self):
-        self.vertices = tuple(sorted(self.vertices))
-        self.dimension = len(self.vertices) - 1
+# Triangle enumeration tests this many (edge, vertex) pairs at a time, which
+# keeps its boolean scratch at 16 MB however dense the edge set is.
+TRIANGLE_CHUNK_CELLS = 1 << 24
 
-    def __hash__(self):
-        return hash(self.vertices)
 
-    def __eq__(self, other):
-        return self.vertices == other.vertices
+def pack_vertices(vertices: np.ndarray) -> np.ndarray:
+    """Pack sorted vertex rows (..., k+1) into uint64 keys of shape (...)."""
+    vertices = vertices.astype(np.uint64)
+    keys = np.zeros(vertices.shape[:-1], dtype=np.uint64)
+    for c in range(vertices.shape[-1]):
+        keys |= vertices[..., c] << np.uint64(VERTEX_BITS * c)
+    return keys
 
-    def __repr__(self):
-        return f"{self.dimension}-simplex({self.vertices})"
+
+def condensed_index(N: int, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """Position of pair (i, j), i < j, in a length N(N-1)/2 pdist vector."""
+    return N * i - i * (i + 1) // 2 + (j - i - 1)
+
+
+@dataclass
+class SimplexArray:
+    """All k-simplices of one dimension, stored column-wise (SoA)."""
+    vertices: np.ndarray  # (M, k+1) int32, each row sorted ascending
+    radii: np.ndarray     # (M,) filtration radius
+
+    @classmethod
+    def empty(cls, dimension: int) -> "SimplexArray":
+        return cls(
+            vertices=np.empty((0, dimension + 1), dtype=np.int32),
+            radii=np.empty(0, dtype=np.float64)
+        )
+
+    @property
+    def dimension(self) -> int:
+        return self.vertices.shape[1] - 1
+
+    def __len__(self) -> int:
+        return self.vertices.shape[0]
 
 
 @dataclass
@@ -81,59 +106,126 @@ class VietorisRipsComplex:
 
     def __init__(self, config: TDAConfig):
         self.config = config
-        self.simplices: Dict[int, Set[Simplex]] = defaultdict(set)
-        self.filtration: List[Simplex] = []
+        # Per-dimension simplices, each sorted by radius after build()
+        self.simplices: Dict[int, SimplexArray] = {}
+        # dim -> (sorted packed vertex keys, their positions in simplices[dim])
+        self.face_index: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        # Whole filtration as parallel arrays sorted by radius; vertex rows
+        # are padded with -1 up to max_dim + 1 columns
+        self.filtration_vertices = np.empty((0, config.max_dim + 1), dtype=np.int32)
+        self.filtration_radii = np.empty(0)
+        self.filtration_dims = np.empty(0, dtype=np.int8)
 
     def build(self, points: np.ndarray, distance_matrix: Optional[np.ndarray] = None) -> None:
         N = points.shape[0]
+        if N > MAX_VERTICES:
+            raise ValueError(f"At most {MAX_VERTICES} points supported, got {N}")
 
+        # Distances are kept condensed (pdist layout): only i < j is ever read
         if distance_matrix is None:
-            distance_matrix = self._compute_distance_matrix(points)
+            distances = self._compute_distances(points)
+        elif distance_matrix.ndim == 2:
+            distances = squareform(distance_matrix, checks=False)
+        else:
+            distances = distance_matrix
 
         # 0-simplices (vertices)
-        for i in range(N):
-            self.simplices[0].add(Simplex(vertices=(i,), dimension=0, radius=0.0))
-
-        # 1-simplices (edges)
-        edges = []
-        for i in range(N):
-            for j in range(i + 1, N):
-                radius = distance_matrix[i, j]
-                if radius <= self.config.max_radius:
-                    edge = Simplex(vertices=(i, j), dimension=1, radius=radius)
-                    edges.append(edge)
-                    self.simplices[1].add(edge)
-
-        # 2-simplices (triangles)
-        triangles = []
-        if self.config.max_dim >= 2:
-            for i in range(N):
-                for j in range(i + 1, N):
-                    for k in range(j + 1, N):
-                        max_edge = max(
-                            distance_matrix[i, j],
-                            distance_matrix[i, k],
-                            distance_matrix[j, k]
-                        )
-                        if max_edge <= self.config.max_radius:
-                            tri = Simplex(vertices=(i, j, k), dimension=2, radius=max_edge)
-                            triangles.append(tri)
-                            self.simplices[2].add(tri)
-
-        all_simplices = list(self.simplices[0]) + edges + triangles
-        self.filtration = sorted(all_simplices, key=lambda s: s.radius)
-
-    def _compute_distance_matrix(self, points: np.ndarray) -> np.ndarray:
-        N = points.shape[0]
-        dist_matrix = np.zeros((N, N))
-
-        for i in range(N):
-            for j in range(i + 1, N):
-                dist = np.linalg.norm(points[i] - points[j])
-                dist_matrix[i, j] = dist
-                dist_matrix[j, i] = dist
-
-        return dist_matrix
+        self.simplices[0] = SimplexArray(
+            vertices=np.arange(N, dtype=np.int32)[:, None],
+            radii=np.zeros(N)
+        )
+
+        # 1-simplices (edges): all i < j pairs at once, masked by radius;
+        # triu_indices enumerates pairs in the same order as the condensed vector
+        I, J = np.triu_indices(N, k=1)
+        mask = distances <= self.config.max_radius
+        edge_i, edge_j, edge_radii = I[mask], J[mask], distances[mask]
+
+        self.simplices[1] = SimplexArray(
+            vertices=np.stack([edge_i, edge_j], axis=1).astype(np.int32),
+            radii=edge_radii
+        )
+
+        # 2-simplices (triangles): a triangle exists iff all three edges do,
+        # so extend each edge (i, j) by every k > j adjacent to both ends
+        self.simplices[2] = SimplexArray.empty(2)
+        if self.config.max_dim >= 2 and edge_i.size:
+            adjacency = np.zeros((N, N), dtype=bool)
+            adjacency[edge_i, edge_j] = True
+
+            # (E, N) at once would be ~N^3/2 bytes for dense radii, so go
+            # through the edges in chunks; row-major nonzero keeps edge order
+            chunk = max(1, TRIANGLE_CHUNK_CELLS // N)
+            e_idx, tri_k = [], []
+            for start in range(0, edge_i.size, chunk):
+                stop = start + chunk
+                rows, cols = np.nonzero(
+                    adjacency[edge_i[start:stop]] & adjacency[edge_j[start:stop]]
+                )
+                e_idx.append(rows + start)
+                tri_k.append(cols)
+            e_idx, tri_k = np.concatenate(e_idx), np.concatenate(tri_k)
+            tri_i, tri_j = edge_i[e_idx], edge_j[e_idx]
+            tri_radii = np.maximum(
+                np.maximum(edge_radii[e_idx], distances[condensed_index(N, tri_i, tri_k)]),
+                distances[condensed_index(N, tri_j, tri_k)]
+            )
+
+            self.simplices[2] = SimplexArray(
+                vertices=np.stack([tri_i, tri_j, tri_k], axis=1).astype(np.int32),
+                radii=tri_radii
+            )
+
+        # Higher dimensions (tetrahedra at max_dim=3) are not enumerated yet
+        for dim in range(3, self.config.max_dim + 2):
+            self.simplices[dim] = SimplexArray.empty(dim)
+
+        self._sort_and_index()
+        self._build_filtration()
+
+    def _sort_and_index(self) -> None:
+        # Sorted once here so persistence never re-sorts per call; only
+        # dimensions with cofaces need a key index for boundary lookup
+        for dim, simplices in self.simplices.items():
+            order = np.argsort(simplices.radii, kind='stable')
+            self.simplices[dim] = SimplexArray(
+                vertices=simplices.vertices[order], radii=simplices.radii[order]
+            )
+
+        self.face_index = {}
+        for dim in range(1, self.config.max_dim + 1):
+            if len(self.simplices.get(dim + 1, ())) == 0:
+                continue
+            keys = pack_vertices(self.simplices[dim].vertices)
+            key_order = np.argsort(keys)
+            self.face_index[dim] = (keys[key_order], key_order)
+
+    def face_rows(self, dim: int, faces: np.ndarray) -> np.ndarray:
+        """Positions in simplices[dim] of sorted vertex rows (..., dim+1)."""
+        sorted_keys, key_order = self.face_index[dim]
+        return key_order[np.searchsorted(sorted_keys, pack_vertices(faces))]
+
+    def _build_filtration(self) -> None:
+        # Dimensions are concatenated in increasing order and the sort is
+        # stable, so faces precede cofaces that share their radius
+        width = self.config.max_dim + 1
+        dims = sorted(d for d in self.simplices if d < width)
+        vertices = np.concatenate([
+            np.pad(self.simplices[d].vertices, ((0, 0), (0, width - d - 1)), constant_values=-1)
+            for d in dims
+        ])
+        radii = np.concatenate([self.simplices[d].radii for d in dims])
+        dimensions = np.concatenate([
+            np.full(len(self.simplices[d]), d, dtype=np.int8) for d in dims
+        ])
+
+        order = np.argsort(radii, kind='stable')
+        self.filtration_vertices = vertices[order]
+        self.filtration_radii = radii[order]
+        self.filtration_dims = dimensions[order]
+
+    def _compute_distances(self, points: np.ndarray) -> np.ndarray:
+        return pdist(points)
 
 
 class PersistentHomology:
@@ -145,62 +237,117 @@ class PersistentHomology:
     def compute(self, vr_complex: VietorisRipsComplex) -> Dict[int, List[PersistenceInterval]]:
         intervals: Dict[int, List[PersistenceInterval]] = defaultdict(list)
 
+        # Each reduction also reports which cofaces are positive (create a
+        # class), which the next dimension needs for its essential classes
+        positive = None
         for dim in range(self.config.max_dim + 1):
-            intervals[dim] = self._compute_dim_persistence(vr_complex, dim)
+            intervals[dim], positive = self._compute_dim_persistence(vr_complex, dim, positive)
 
         return intervals
 
     def _compute_dim_persistence(
-        self, vr_complex: VietorisRipsComplex, dim: int
-    ) -> List[PersistenceInterval]:
-        simplices_dim = sorted(list(vr_complex.simplices[dim]), key=lambda s: s.radius)
-        simplices_next = sorted(list(vr_complex.simplices[dim + 1]), key=lambda s: s.radius)
+        self, vr_complex: VietorisRipsComplex, dim: int, positive: Optional[np.ndarray] = None
+    ) -> Tuple[List[PersistenceInterval], np.ndarray]:
+        """Pairs of ∂_{dim+1}, plus indices of the positive (dim+1)-simplices.
 
-        simplex_to_idx = {s: i for i, s in enumerate(simplices_dim)}
+        positive holds the dim-simplices that create classes (None: all of
+        them, as for vertices); it only matters when nothing can kill them.
+        """
+        simplices_dim = vr_complex.simplices[dim]
+        simplices_next = vr_complex.simplices.get(dim + 1)
+        radii_dim = simplices_dim.radii
 
         num_dim = len(simplices_dim)
-        num_next = len(simplices_next)
+        num_next = 0 if simplices_next is None else len(simplices_next)
 
         if num_next == 0:
+            # No cofaces: every positive simplex is an essential class
+            births = radii_dim if positive is None else radii_dim[positive]
             return [
-                PersistenceInterval(dimension=dim, birth=s.radius, death=float('inf'))
-                for s in simplices_dim
-            ]
+                PersistenceInterval(dimension=dim, birth=r, death=float('inf'))
+                for r in births.tolist()
+            ], np.empty(0, dtype=np.int64)
 
-        # Boundary operator ∂: C_{dim+1} → C_dim
-        rows, cols, data = [], [], []
-        for j, simplex in enumerate(simplices_next):
-            for k in range(dim + 2):
-                face_verts = list(simplex.vertices)
-                face_verts.pop(k)
-                face = Simplex(vertices=tuple(face_verts))
-
-                if face in simplex_to_idx:
-                    rows.append(simplex_to_idx[face])
-                    cols.append(j)
-                    data.append((-1) ** k)
-
-        if data:
-            boundary_matrix = csr_matrix((data, (rows, cols)), shape=(num_dim, num_next))
-        else:
-            boundary_matrix = csr_matrix((num_dim, num_next))
+        verts_next = simplices_next.vertices
+        radii_next = simplices_next.radii
+
+        if dim == 0:
+            return self._compute_h0_persistence(num_dim, verts_next, radii_next)
 
-        # Simplified persistence: feature dies when a (dim+1)-simplex "fills" it
+        # Boundary operator ∂: C_{dim+1} → C_dim
+        # Row k of leave_one_out drops vertex k; vertex rows stay sorted,
+        # so every gathered face packs to the same key as its simplex
+        leave_one_out = np.array([
+            [c for c in range(dim + 2) if c != k] for k in range(dim + 2)
+        ])
+        faces = verts_next[:, leave_one_out]  # (num_next, dim+2, dim+1)
+
+        rows = vr_complex.face_rows(dim, faces).ravel()
+        cols = np.repeat(np.arange(num_next), dim + 2)
+        data = np.ones(num_next * (dim + 2), dtype=np.int8)  # Z/2 coefficients
+
+        boundary_matrix = csc_matrix((data, (rows, cols)), shape=(num_dim, num_next))
+
+        # Column reduction: a (dim+1)-simplex whose reduced boundary is
+        # non-empty kills the class born at its lowest (latest) row.
+        # Columns are int bitsets (bit i = row i): adding two columns over
+        # Z/2 is one XOR and the lowest row is bit_length() - 1.
         intervals = []
-        for i, simplex in enumerate(simplices_dim):
-            birth = simplex.radius
-            death = float('inf')
+        pivot_column: Dict[int, int] = {}
+        zero_columns = []
+        indptr, indices = boundary_matrix.indptr, boundary_matrix.indices
+        births, deaths = radii_dim.tolist(), radii_next.tolist()
+
+        for j in range(num_next):
+            column = 0
+            for row in indices[indptr[j]:indptr[j + 1]].tolist():
+                column |= 1 << row
+
+            while column:
+                low = column.bit_length() - 1
+                if low not in pivot_column:
+                    break
+                column ^= pivot_column[low]
+
+            if not column:
+                zero_columns.append(j)
+                continue
+
+            pivot_column[low] = column
+            birth, death = births[low], deaths[j]
+            if death > birth:
+                intervals.append(PersistenceInterval(dimension=dim, birth=birth, death=death))
 
-            for next_simplex in simplices_next:
-                if next_simplex.radius > birth:
-                    if set(simplex.vertices).issubset(set(next_simplex.vertices)):
-                        death = next_simplex.radius
-                        break
+        return intervals, np.array(zero_columns, dtype=np.int64)
 
-            if death < float('inf'):
-                intervals.append(PersistenceInterval(dimension=dim, birth=birth, death=death))
+    def _compute_h0_persistence(
+        self, num_vertices: int, edges: np.ndarray, edge_radii: np.ndarray
+    ) -> Tuple[List[PersistenceInterval], np.ndarray]:
+        """Union-find over radius-sorted edges: each merge kills a component.
 
-        return intervals
+        Edges joining an already-connected pair close a cycle; their
+        indices are returned as the positive edges.
+        """
+        parent = list(range(num_vertices))
+
+        def find(v: int) -> int:
+            while parent[v] != v:
+                parent[v] = parent[parent[v]]
+                v = parent[v]
+            return v
+
+        intervals = []
+        cycle_edges = []
+        for j, ((u, v), death) in enumerate(zip(edges.tolist(), edge_radii.tolist())):
+            root_u, root_v = find(u), find(v)
+            if root_u == root_v:
+                cycle_edges.append(j)
+                continue
+            parent[root_v] = root_u
+            if death > 0.0:
+                intervals.append(PersistenceInterval(dimension=0, birth=0.0, death=death))
+
+        return intervals, np.array(cycle_edges, dtype=np.int64)
 
 
 def analyze_barcodes(